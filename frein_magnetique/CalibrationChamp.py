@@ -0,0 +1,157 @@
+import copy
+import time
+import numpy as np
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from .Constantes import *
+from .Champ_magnetique import Champ_mag
+from .Satellite_mag import Satellite_magnetique
+from .Convergence import simuler_temps_desorbitation, verifier_desorbitation
+
+
+class CalibrationChamp:
+    """
+    Classe évaluant l'erreur commise par les modèles de champ simplifiés par rapport à l'IGRF complet.
+
+    L'erreur est évaluée sur la composante tangente Bt le long d'une orbite de référence (altitude et inclinaison
+    initiales du scénario) et sur le temps de désorbitation obtenu par simulation complète.
+
+    Attributs:
+        parsed_data (dict): Paramètres de simulation lus par LecteurYAML.
+        fidelites (list): Couples (fidelite, degre) comparés à l'IGRF complet.
+        erreurs_Bt (dict): Erreurs relatives RMS et maximale sur Bt et durée d'une évaluation, par modèle.
+        temps (dict): Temps de désorbitation en jours, par modèle (dont 'igrf').
+        erreurs_desorbitation (dict): Erreur relative sur le temps de désorbitation, par modèle.
+    """
+
+    def __init__(self, parsed_data, fidelites=(('dipole', 1), ('igrf_tronque', 3))):
+        """
+        Initialise la calibration.
+
+        Args:
+            parsed_data (dict): Paramètres de simulation lus par LecteurYAML.
+            fidelites (tuple): Couples (fidelite, degre) à comparer à l'IGRF complet
+                (par défaut le dipôle et l'IGRF tronqué au degré 3).
+        """
+        self.parsed_data = parsed_data
+        self.fidelites = list(fidelites)
+        self.erreurs_Bt = {}
+        self.temps = {}
+        self.erreurs_desorbitation = {}
+
+    def nom_modele(self, fidelite, degre):
+        """
+        Retourne le nom affiché d'un modèle de champ.
+
+        Args:
+            fidelite (str): Fidélité du modèle.
+            degre (int): Degré de troncature.
+
+        Returns:
+            str: Nom du modèle.
+        """
+        if fidelite == 'igrf_tronque':
+            return f'igrf_tronque (degré {degre})'
+        return fidelite
+
+    def calculer_Bt_orbite(self, champ_mag, revolutions, points_par_revolution):
+        """
+        Calcule Bt le long de l'orbite de référence du scénario.
+
+        Args:
+            champ_mag (Champ_mag): Modèle de champ magnétique évalué.
+            revolutions (int): Nombre de révolutions parcourues.
+            points_par_revolution (int): Nombre de points de calcul par révolution.
+
+        Returns:
+            numpy.ndarray: Composante tangente du champ magnétique en Tesla pour chaque point.
+        """
+        donnees_orbite = self.parsed_data['orbite']
+        satellite = Satellite_magnetique(0, 0, None)
+        satellite.set_position(r=donnees_orbite['altitude'] + rayon_terre)
+        positions = np.linspace(0, 2 * np.pi * revolutions, revolutions * points_par_revolution, endpoint=False)
+        Bt = []
+        for position_sur_equateur in positions[1:]:
+            satellite.update_etat(position_sur_equateur, donnees_orbite['inclinaison'])
+            Bt.append(float(champ_mag.calculer_Bt(satellite)))
+        return np.array(Bt)
+
+    def calibrer_Bt(self, revolutions=1, points_par_revolution=360):
+        """
+        Compare Bt le long de l'orbite de référence pour chaque modèle et l'IGRF complet.
+
+        Args:
+            revolutions (int, optional): Nombre de révolutions parcourues (par défaut 1).
+            points_par_revolution (int, optional): Nombre de points de calcul par révolution (par défaut 360).
+
+        Returns:
+            dict: Erreurs relatives RMS et maximale sur Bt et durée d'une évaluation, par modèle.
+        """
+        donnees_date = self.parsed_data['date']
+        date = datetime(donnees_date['year'], donnees_date['month'], donnees_date['day'])
+
+        debut = time.perf_counter()
+        Bt_reference = self.calculer_Bt_orbite(Champ_mag(date), revolutions, points_par_revolution)
+        duree_reference = (time.perf_counter() - debut) / len(Bt_reference)
+        norme_rms = np.sqrt(np.mean(Bt_reference ** 2))
+        norme_max = np.max(np.abs(Bt_reference))
+        self.erreurs_Bt['igrf'] = {'erreur_rms': 0.0, 'erreur_max': 0.0, 'duree_evaluation': duree_reference}
+
+        for fidelite, degre in self.fidelites:
+            debut = time.perf_counter()
+            Bt = self.calculer_Bt_orbite(Champ_mag(date, fidelite, degre), revolutions, points_par_revolution)
+            duree = (time.perf_counter() - debut) / len(Bt)
+            ecart = Bt - Bt_reference
+            self.erreurs_Bt[self.nom_modele(fidelite, degre)] = {
+                'erreur_rms': np.sqrt(np.mean(ecart ** 2)) / norme_rms,
+                'erreur_max': np.max(np.abs(ecart)) / norme_max,
+                'duree_evaluation': duree,
+            }
+        return self.erreurs_Bt
+
+    def calibrer_desorbitation(self, approche='energetique', dt=None, processus=None):
+        """
+        Simule le scénario avec chaque modèle de champ en parallèle et compare les temps de désorbitation.
+
+        Args:
+            approche (str, optional): Approche utilisée pour les calculs (par défaut 'energetique').
+            dt (float, optional): Pas de temps des simulations (par défaut celui du fichier YAML).
+            processus (int, optional): Nombre de processus (par défaut le nombre de coeurs disponibles).
+
+        Returns:
+            dict: Erreur relative sur le temps de désorbitation, par modèle.
+
+        Raises:
+            RuntimeError: Si une simulation a été interrompue avant d'atteindre 100 km (voir verifier_desorbitation).
+        """
+        if dt is None:
+            dt = self.parsed_data['orbite']['dt']
+
+        scenarios = {'igrf': ('igrf', 3)}
+        for fidelite, degre in self.fidelites:
+            scenarios[self.nom_modele(fidelite, degre)] = (fidelite, degre)
+
+        with ProcessPoolExecutor(max_workers=processus) as executeur:
+            futurs = {}
+            for nom, (fidelite, degre) in scenarios.items():
+                donnees = copy.deepcopy(self.parsed_data)
+                donnees['champ_magnetique'] = {'fidelite': fidelite, 'degre': degre}
+                futurs[nom] = executeur.submit(simuler_temps_desorbitation, donnees, approche, dt)
+            resultats = {nom: futur.result() for nom, futur in futurs.items()}
+        self.temps = verifier_desorbitation(resultats)
+
+        self.erreurs_desorbitation = {nom: abs(t - self.temps['igrf']) / self.temps['igrf']
+                                      for nom, t in self.temps.items()}
+        return self.erreurs_desorbitation
+
+    def afficher_resultats(self):
+        """
+        Affiche les erreurs sur Bt et sur le temps de désorbitation de chaque modèle.
+        """
+        for nom, erreurs in self.erreurs_Bt.items():
+            print(f"{nom} : erreur Bt RMS = {erreurs['erreur_rms'] * 100:0.2f} %, "
+                  f"erreur Bt max = {erreurs['erreur_max'] * 100:0.2f} %, "
+                  f"durée d'une évaluation = {erreurs['duree_evaluation'] * 1000:0.3f} ms")
+        for nom, erreur in self.erreurs_desorbitation.items():
+            print(f"{nom} : temps de désorbitation = {self.temps[nom]:0.4f} jours, "
+                  f"erreur relative = {erreur * 100:0.3f} %")
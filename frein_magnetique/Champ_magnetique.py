@@ -1,9 +1,84 @@
 import ppigrf
+from ppigrf import ppigrf as igrf_module
+import numpy as np
+import pandas as pd
 from math import cos, sin, pi
 from datetime import timedelta
 from numpy import squeeze
 from .Constantes import *
 
+FIDELITES = ('igrf', 'igrf_tronque', 'dipole')
+
+
+def interpoler_coefficients(date, degre):
+    """
+    Interpole les coefficients de Gauss de l'IGRF à une date donnée et les tronque à un degré maximal.
+
+    Parameters
+    ----------
+    date : datetime.datetime
+        Date à laquelle les coefficients sont interpolés.
+    degre : int
+        Degré maximal conservé (1 pour un dipôle incliné, 13 pour l'IGRF complet).
+
+    Returns
+    -------
+    tuple
+        Clés (n, m) conservées et coefficients g et h correspondants en nT.
+    """
+    g, h = igrf_module.read_shc()
+    cles = [cle for cle in g.columns if cle[0] <= degre]
+    index = g.index.union(pd.DatetimeIndex([date]))
+    g = g[cles].reindex(index).groupby(index).first().interpolate(method='time').loc[date]
+    h = h[cles].reindex(index).groupby(index).first().interpolate(method='time').loc[date]
+    return cles, g.values, h.values
+
+
+def igrf_tronque(lon, lat, h, coefficients):
+    """
+    Calcule les composantes du champ magnétique à partir de coefficients de Gauss tronqués.
+
+    Les calculs reprennent ceux de ppigrf.igrf (coordonnées géodésiques en entrée et en sortie) sans
+    relire le fichier de coefficients à chaque appel.
+
+    Parameters
+    ----------
+    lon : array
+        Longitude en degrés, positive vers l'est.
+    lat : array
+        Latitude géodésique en degrés.
+    h : array
+        Altitude au-dessus de l'ellipsoïde en km.
+    coefficients : tuple
+        Clés (n, m) et coefficients g et h retournés par interpoler_coefficients.
+
+    Returns
+    -------
+    tuple
+        Composantes est, nord et radiale du champ magnétique en nT.
+    """
+    cles, g, hc = coefficients
+    lon, lat, h = np.broadcast_arrays(*(np.asarray(x, dtype=float).ravel() for x in (lon, lat, h)))
+
+    theta, r, _, __ = igrf_module.geod2geoc(lat, h, h, h)
+    theta, r, phi = theta.reshape((-1, 1)), r.reshape((-1, 1)), lon.reshape((-1, 1))
+
+    n, m = np.array(cles).T
+    n, m = n.reshape((1, -1)), m.reshape((1, -1))
+    P, dP = igrf_module.get_legendre(theta, cles)
+
+    cosmphi = np.cos(np.radians(phi) * m)
+    sinmphi = np.sin(np.radians(phi) * m)
+    RE = igrf_module.RE
+
+    Br = ((RE / r) ** (n + 2) * (n + 1) * P * (cosmphi * g + sinmphi * hc)).sum(axis=1)
+    Btheta = -((RE / r) ** (n + 2) * dP * (cosmphi * g + sinmphi * hc)).sum(axis=1)
+    Bphi = -((RE / r) ** (n + 2) * m * P * (-sinmphi * g + cosmphi * hc)).sum(axis=1) \
+        / np.sin(np.radians(theta.ravel()))
+
+    _, __, Bn, Bu = igrf_module.geoc2geod(theta.ravel(), r.ravel(), Btheta, Br)
+    return Bphi, Bn, Bu
+
 
 class Champ_mag:
     """
@@ -15,6 +90,11 @@ class Champ_mag:
         La date initiale pour les calculs du champ magnétique.
     dt : int
         Le temps écoulé depuis la date initiale, en secondes.
+    fidelite : str
+        Le modèle de champ utilisé : 'igrf' (IGRF complet), 'igrf_tronque' (IGRF tronqué au degré `degre`)
+        ou 'dipole' (dipôle incliné, soit l'IGRF tronqué au degré 1).
+    degre : int
+        Le degré de troncature utilisé par la fidélité 'igrf_tronque'.
     be : float
         La composante est du champ magnétique en Tesla.
     bn : float
@@ -29,9 +109,11 @@ class Champ_mag:
     calculer_Bt(satellite, dt=0, vitesse=None)
         Calcule la composante tangente du champ magnétique en fonction de la position
         et de la vitesse angulaire du satellite.
+    calculer_composantes(altitude, latitude, longitude, date)
+        Calcule les composantes est, nord et radiale du champ magnétique selon la fidélité choisie.
     """
 
-    def __init__(self, date):
+    def __init__(self, date, fidelite='igrf', degre=3):
         """
         Initialise la classe champ_mag avec la date donnée.
 
@@ -39,9 +121,46 @@ class Champ_mag:
         ----------
         date : datetime.date
             La date initiale pour les calculs du champ magnétique.
+        fidelite : str, optional
+            Le modèle de champ utilisé, 'igrf', 'igrf_tronque' ou 'dipole' (default is 'igrf').
+        degre : int, optional
+            Le degré de troncature utilisé par la fidélité 'igrf_tronque' (default is 3).
         """
+        if fidelite not in FIDELITES:
+            raise ValueError(f"Fidélité inconnue : {fidelite} (valeurs possibles : {', '.join(FIDELITES)})")
         self.date = date
         self.dt = 0
+        self.fidelite = fidelite
+        self.degre = 1 if fidelite == 'dipole' else degre
+        self.coefficients = {}
+
+    def calculer_composantes(self, altitude, latitude, longitude, date):
+        """
+        Calcule les composantes est, nord et radiale du champ magnétique selon la fidélité choisie.
+
+        Parameters
+        ----------
+        altitude : float or array
+            Altitude en km.
+        latitude : float or array
+            Latitude en degrés.
+        longitude : float or array
+            Longitude en degrés, entre -180 et 180.
+        date : datetime.datetime
+            Date du calcul.
+
+        Returns
+        -------
+        tuple
+            Composantes est, nord et radiale du champ magnétique en nT.
+        """
+        if self.fidelite == 'igrf':
+            return ppigrf.igrf(longitude, latitude, altitude, date)
+
+        # Les coefficients tronqués sont interpolés une seule fois par jour simulé
+        if date not in self.coefficients:
+            self.coefficients[date] = interpoler_coefficients(date, self.degre)
+        return igrf_tronque(longitude, latitude, altitude, self.coefficients[date])
 
     def calculer_Bt(self, satellite, dt=0, vitesse=None):
         """
@@ -76,7 +195,7 @@ class Champ_mag:
         if phi >=180:
             phi  = phi-360
 
-        [be, bn, bu] = ppigrf.igrf(phi, theta, r, new_date)
+        [be, bn, bu] = self.calculer_composantes(r, theta, phi, new_date)
 
         self.be = squeeze(be) / 10 ** 9
         self.bn = squeeze(bn) / 10 ** 9
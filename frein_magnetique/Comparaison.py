@@ -0,0 +1,204 @@
+import numpy as np
+from math import cos, sin, pi
+from datetime import timedelta
+from .Constantes import *
+from .Scenario import construire_scenario
+from .TableChamp import TableChamp
+
+APPROCHES = ('energetique', 'pfd')
+
+
+class ChampPartage:
+    """
+    Champ magnétique dont les évaluations sont partagées entre plusieurs simulations.
+
+    Chaque simulation possède sa propre instance (et donc sa propre horloge) mais toutes utilisent le même
+    cache. Les composantes est et nord du champ sont réutilisées lorsque le rayon, la latitude, la longitude
+    et le jour tombent dans le même intervalle du cache.
+
+    Attributes
+    ----------
+    champ_mag : Champ_mag
+        Le modèle de champ évalué en cas d'absence dans le cache.
+    cache : dict
+        Le cache partagé, indexé par (rayon, latitude, longitude, jour) discrétisés.
+    pas_rayon : float
+        La largeur d'un intervalle de rayon en mètres.
+    pas_angle : float
+        La largeur d'un intervalle de latitude et de longitude en degrés.
+    """
+
+    def __init__(self, champ_mag, cache, pas_rayon=1000, pas_angle=0.1):
+        """
+        Initialise le champ partagé.
+
+        Parameters
+        ----------
+        champ_mag : Champ_mag
+            Le modèle de champ évalué en cas d'absence dans le cache.
+        cache : dict
+            Le cache partagé entre les simulations.
+        pas_rayon : float, optional
+            La largeur d'un intervalle de rayon en mètres (default is 1000).
+        pas_angle : float, optional
+            La largeur d'un intervalle de latitude et de longitude en degrés (default is 0.1).
+        """
+        self.champ_mag = champ_mag
+        self.cache = cache
+        self.pas_rayon = pas_rayon
+        self.pas_angle = pas_angle
+        self.date = champ_mag.date
+        self.dt = 0
+        self.nb_evaluations = 0
+        self.nb_reutilisations = 0
+
+    def calculer_Bt(self, satellite, dt=0, vitesse=None):
+        """
+        Calcule la composante tangente du champ magnétique, en réutilisant le cache si possible.
+
+        Parameters
+        ----------
+        satellite : Satellite_magnetique
+            Le satellite.
+        dt : int, optional
+            Temps écoulé en secondes à ajouter à `self.dt` (default is 0).
+        vitesse : float, optional
+            Vitesse angulaire du satellite par rapport au nord (default is None).
+            Si None, utilise `satellite.angle_nord_vitesse`.
+
+        Returns
+        -------
+        float
+            La composante tangente du champ magnétique en Tesla.
+        """
+        if vitesse is None:
+            vitesse = satellite.angle_nord_vitesse
+        self.dt += dt
+        jour = self.dt // (24 * 3600)
+        theta = satellite.get_theta() * 180 / pi
+        phi = satellite.get_phi() * 180 / pi
+        if phi >= 180:
+            phi = phi - 360
+
+        cle = (int(satellite.get_r() // self.pas_rayon), round(theta / self.pas_angle), round(phi / self.pas_angle),
+               jour)
+        self.nb_evaluations += 1
+        if cle in self.cache:
+            self.nb_reutilisations += 1
+        else:
+            r = (satellite.get_r() - rayon_terre) // 1000
+            be, bn, bu = self.champ_mag.calculer_composantes(r, theta, phi, self.date + timedelta(jour))
+            self.cache[cle] = (float(np.ravel(be)[0]) / 10 ** 9, float(np.ravel(bn)[0]) / 10 ** 9)
+
+        self.be, self.bn = self.cache[cle]
+        self.bt = self.bn * sin(vitesse) + self.be * cos(vitesse)
+        return self.bt
+
+
+class ComparaisonApproches:
+    """
+    Classe simulant en parallèle, pas à pas, les approches énergétique et PFD sur un même scénario.
+
+    Les deux formulations avancent ensemble dans une seule boucle. Elles partagent l'atmosphère et un cache
+    des évaluations du champ magnétique (voir ChampPartage).
+
+    Attributs:
+        parsed_data (dict): Paramètres de simulation lus par LecteurYAML.
+        orbites (dict): Orbite simulée pour chaque approche.
+        satellites (dict): Satellite simulé pour chaque approche.
+        champs (dict): Champ partagé utilisé par chaque approche.
+        cache (dict): Cache des évaluations du champ magnétique commun aux deux approches.
+    """
+
+    def __init__(self, parsed_data, pas_rayon=1000, pas_angle=0.1):
+        """
+        Initialise la comparaison à partir des paramètres du fichier YAML.
+
+        Args:
+            parsed_data (dict): Paramètres de simulation lus par LecteurYAML.
+            pas_rayon (float, optional): Largeur d'un intervalle de rayon du cache en mètres (par défaut 1000).
+            pas_angle (float, optional): Largeur d'un intervalle angulaire du cache en degrés (par défaut 0.1).
+        """
+        self.parsed_data = parsed_data
+        self.cache = {}
+        self.orbites = {}
+        self.satellites = {}
+        self.champs = {}
+
+        atmosphere = None
+        for approche in APPROCHES:
+            orbite, satellite, atmosphere, champ_mag = construire_scenario(parsed_data, atmosphere=atmosphere)
+            if isinstance(champ_mag, TableChamp):
+                champ_mag = champ_mag.champ_mag
+            self.orbites[approche] = orbite
+            self.satellites[approche] = satellite
+            self.champs[approche] = ChampPartage(champ_mag, self.cache, pas_rayon, pas_angle)
+        self.atmosphere = atmosphere
+
+    def executer(self):
+        """
+        Simule les deux approches pas à pas jusqu'à la fin des deux simulations.
+
+        Returns:
+            dict: Temps de désorbitation en jours pour chaque approche.
+        """
+        for approche, orbite in self.orbites.items():
+            orbite.initialiser_simulation(self.satellites[approche], self.atmosphere, self.champs[approche], approche)
+
+        actives = list(self.orbites.values())
+        while actives:
+            actives = [orbite for orbite in actives if orbite.avancer()]
+
+        return {approche: orbite.terminer_simulation() for approche, orbite in self.orbites.items()}
+
+    def rapport(self):
+        """
+        Calcule les écarts entre les deux approches.
+
+        Returns:
+            dict: Temps de désorbitation de chaque approche (en jours), écart relatif sur le temps de
+            désorbitation, écart maximal de rayon sur la partie commune des trajectoires (en mètres) et
+            fraction des évaluations du champ réutilisées depuis le cache.
+        """
+        temps = {approche: orbite.temps[-1] / (24 * 3600) for approche, orbite in self.orbites.items()}
+        rayons = [np.asarray(orbite.rayon) for orbite in self.orbites.values()]
+        n = min(len(rayon) for rayon in rayons)
+        evaluations = sum(champ.nb_evaluations for champ in self.champs.values())
+        reutilisations = sum(champ.nb_reutilisations for champ in self.champs.values())
+        return {
+            'temps': temps,
+            'ecart_temps': abs(temps['energetique'] - temps['pfd']) / temps['energetique'],
+            'ecart_rayon_max': float(np.max(np.abs(rayons[0][:n] - rayons[1][:n]))),
+            'reutilisation_cache': reutilisations / evaluations if evaluations else 0.0,
+        }
+
+    def afficher_resultats(self):
+        """
+        Affiche les temps de désorbitation et les écarts entre les deux approches.
+        """
+        rapport = self.rapport()
+        for approche, temps in rapport['temps'].items():
+            print(f'Temps de désorbitation ({approche}) = {temps:0.4f} jours ({self.orbites[approche].statut})')
+        print(f"Écart relatif sur le temps de désorbitation = {rapport['ecart_temps'] * 100:0.3f} %")
+        print(f"Écart maximal de rayon = {rapport['ecart_rayon_max']:0.1f} m")
+        print(f"Évaluations du champ réutilisées = {rapport['reutilisation_cache'] * 100:0.1f} %")
+
+    def save_data(self, filename):
+        """
+        Sauvegarde les trajectoires des deux approches dans un seul fichier.
+
+        Les deux approches partagent le même pas de temps ; la trajectoire la plus courte est complétée par NaN.
+
+        Args:
+            filename (str): Nom du fichier dans lequel les données seront sauvegardées.
+        """
+        n = max(len(orbite.temps) for orbite in self.orbites.values())
+        dt = self.orbites['energetique'].dt
+        colonnes = [np.arange(n) * dt]
+        for orbite in self.orbites.values():
+            rayon = np.full(n, np.nan)
+            rayon[:len(orbite.rayon)] = orbite.rayon
+            colonnes.append(rayon)
+        colonnes.append(colonnes[1] - colonnes[2])
+        entete = "temps ; rayon de l'orbite (energetique) ; rayon de l'orbite (pfd) ; ecart de rayon"
+        np.savetxt(filename, np.asarray(colonnes).transpose(), delimiter=';', header=entete)
@@ -0,0 +1,251 @@
+import copy
+import numpy as np
+from multiprocessing import Manager
+from concurrent.futures import ProcessPoolExecutor, wait
+from .Constantes import *
+from .Orbite import STATUT_DESORBITE
+from .Scenario import construire_scenario
+from .LecteurYAML import LecteurYAML
+from .Observateurs import ProgressionAgregee
+
+
+def simuler_temps_desorbitation(parsed_data, approche, dt, observateur=None):
+    """
+    Simule un scénario avec un pas de temps donné. Cette fonction est exécutée dans un processus séparé.
+
+    Args:
+        parsed_data (dict): Paramètres de simulation lus par LecteurYAML.
+        approche (str): Approche utilisée pour les calculs ('energetique' ou 'pfd').
+        dt (float): Pas de temps de la simulation en secondes.
+        observateur (Observateur, optional): Observateur attaché à l'orbite simulée.
+
+    Returns:
+        tuple: Temps de franchissement des 100 km en jours (voir temps_franchissement) et statut de fin de la
+        simulation (voir Orbite.statut). Si le statut n'est pas STATUT_DESORBITE, le temps est le temps simulé.
+    """
+    orbite, satellite, atmosphere, champ_mag = construire_scenario(parsed_data, dt=dt)
+    if observateur is not None:
+        orbite.ajouter_observateur(observateur)
+    orbite.calculer_temps_desorbitation(satellite, atmosphere, champ_mag, approche)
+    return temps_franchissement(orbite), orbite.statut
+
+
+def verifier_desorbitation(resultats):
+    """
+    Vérifie que toutes les simulations d'une étude ont atteint 100 km.
+
+    Une simulation interrompue par un budget (temps simulé, nombre d'étapes, durée de calcul) ou sortie du domaine
+    de la table de densité retourne un temps tronqué, qui ne peut pas être comparé aux autres.
+
+    Args:
+        resultats (dict): Couples (temps, statut) retournés par simuler_temps_desorbitation, indexés par nom.
+
+    Returns:
+        dict: Temps de désorbitation en jours, indexés par nom.
+
+    Raises:
+        RuntimeError: Si une simulation n'a pas atteint 100 km.
+    """
+    interrompues = [f'{nom} ({statut})' for nom, (temps, statut) in resultats.items() if statut != STATUT_DESORBITE]
+    if interrompues:
+        raise RuntimeError("Simulations interrompues avant d'atteindre 100 km : " + ', '.join(interrompues)
+                           + ". Augmentez ou supprimez les budgets de la section orbite du fichier YAML.")
+    return {nom: temps for nom, (temps, statut) in resultats.items()}
+
+
+def temps_franchissement(orbite):
+    """
+    Calcule l'instant exact auquel l'orbite franchit 100 km.
+
+    Le dernier temps de la simulation est le premier échantillon sous 100 km : il dépasse l'instant de
+    franchissement d'au plus un pas de temps. L'instant est donc interpolé linéairement entre les deux
+    derniers échantillons de la trajectoire.
+
+    Args:
+        orbite (Orbite): Orbite dont la simulation est terminée.
+
+    Returns:
+        float: Temps de franchissement des 100 km en jours (dernier temps simulé si 100 km n'a pas été atteint).
+    """
+    temps, rayon = orbite.temps, orbite.rayon
+    rayon_limite = 100000 + rayon_terre
+    if len(temps) < 2 or rayon[-1] > rayon_limite or rayon[-2] == rayon[-1]:
+        return temps[-1] / (24 * 3600)
+    fraction = (rayon[-2] - rayon_limite) / (rayon[-2] - rayon[-1])
+    return (temps[-2] + fraction * (temps[-1] - temps[-2])) / (24 * 3600)
+
+
+class EtudeConvergence:
+    """
+    Classe réalisant une étude de convergence en pas de temps pour choisir le plus grand dt admissible.
+
+    Le même scénario est simulé pour une série de pas de temps dt_max, dt_max/r, dt_max/r^2, ... en parallèle.
+    Une extrapolation de Richardson sur le temps de franchissement des 100 km (interpolé entre les deux derniers
+    pas, voir temps_franchissement) donne une estimation de la solution à dt -> 0, à partir de laquelle l'erreur
+    relative de chaque pas de temps est évaluée.
+
+    Attributs:
+        parsed_data (dict): Paramètres de simulation lus par LecteurYAML.
+        approches (list): Approches étudiées ('energetique' et/ou 'pfd').
+        pas_de_temps (list): Pas de temps simulés, du plus grand au plus petit (en secondes).
+        raffinement (float): Rapport entre deux pas de temps successifs.
+        tolerance (float): Erreur relative admissible sur le temps de désorbitation.
+        ordre_formel (float): Ordre de convergence attendu des intégrateurs, borne l'ordre observé.
+        temps (dict): Temps de désorbitation (en jours) par approche, dans l'ordre de pas_de_temps.
+        ordre (dict): Ordre de convergence retenu par approche.
+        temps_extrapole (dict): Temps de désorbitation extrapolé à dt -> 0 par approche (en jours, NaN si
+            l'extrapolation a été rejetée).
+        erreurs (dict): Erreurs relatives de chaque pas de temps par approche (NaN si l'extrapolation a été rejetée).
+    """
+
+    def __init__(self, parsed_data, approches=('energetique', 'pfd'), dt_max=None, raffinement=2, niveaux=4,
+                 tolerance=0.01, ordre_formel=1):
+        """
+        Initialise une étude de convergence.
+
+        Args:
+            parsed_data (dict): Paramètres de simulation lus par LecteurYAML.
+            approches (tuple): Approches étudiées (par défaut les deux).
+            dt_max (float, optional): Plus grand pas de temps testé (par défaut 4 fois le dt du fichier YAML).
+            raffinement (float): Rapport entre deux pas de temps successifs (par défaut 2).
+            niveaux (int): Nombre de pas de temps testés, au moins 3 (par défaut 4).
+            tolerance (float): Erreur relative admissible sur le temps de désorbitation (par défaut 1 %).
+            ordre_formel (float): Ordre de convergence attendu des intégrateurs (par défaut 1 : les forces sont
+                évaluées une seule fois par pas dans les deux approches).
+        """
+        if niveaux < 3:
+            raise ValueError("L'extrapolation de Richardson nécessite au moins 3 pas de temps")
+        if raffinement <= 1:
+            raise ValueError("Le rapport entre deux pas de temps successifs doit être supérieur à 1")
+        if dt_max is None:
+            dt_max = 4 * parsed_data['orbite']['dt']
+        self.parsed_data = parsed_data
+        self.approches = list(approches)
+        self.raffinement = raffinement
+        self.pas_de_temps = [dt_max / raffinement ** k for k in range(niveaux)]
+        self.tolerance = tolerance
+        self.ordre_formel = ordre_formel
+        self.temps = {}
+        self.ordre = {}
+        self.temps_extrapole = {}
+        self.erreurs = {}
+
+    def executer(self, processus=None, intervalle_rapport=10.0):
+        """
+        Simule le scénario pour tous les pas de temps et toutes les approches en parallèle.
+
+        Args:
+            processus (int, optional): Nombre de processus (par défaut le nombre de coeurs disponibles).
+            intervalle_rapport (float, optional): Durée en secondes entre deux rapports de progression
+                (par défaut 10, None pour ne pas suivre la progression).
+
+        Returns:
+            dict: Pas de temps recommandé par approche (None si aucun ne respecte la tolérance).
+
+        Raises:
+            RuntimeError: Si une simulation a été interrompue avant d'atteindre 100 km (voir verifier_desorbitation).
+        """
+        with Manager() as manager, ProcessPoolExecutor(max_workers=processus) as executeur:
+            progression = ProgressionAgregee(manager.dict()) if intervalle_rapport else None
+            futurs = {approche: [executeur.submit(simuler_temps_desorbitation, self.parsed_data, approche, dt,
+                                                  None if progression is None
+                                                  else progression.observateur(f'{approche} dt={dt}'))
+                                 for dt in self.pas_de_temps]
+                      for approche in self.approches}
+            en_cours = [futur for liste in futurs.values() for futur in liste]
+            while progression is not None and wait(en_cours, timeout=intervalle_rapport).not_done:
+                progression.afficher_rapport()
+            resultats = {(approche, dt): futur.result()
+                         for approche, liste in futurs.items() for dt, futur in zip(self.pas_de_temps, liste)}
+
+        temps = verifier_desorbitation({f'{approche} dt={dt}': resultat
+                                        for (approche, dt), resultat in resultats.items()})
+        for approche in self.approches:
+            self.temps[approche] = [temps[f'{approche} dt={dt}'] for dt in self.pas_de_temps]
+
+        for approche in self.approches:
+            self.extrapoler(approche)
+        return self.recommander()
+
+    def extrapoler(self, approche):
+        """
+        Applique l'extrapolation de Richardson aux trois pas de temps les plus fins.
+
+        L'ordre observé p est estimé à partir des écarts successifs, puis borné entre la moitié et le double de
+        l'ordre formel. Si ces écarts ne sont pas exploitables (nuls, de signes opposés ou de rapport proche
+        de 1), l'ordre formel est supposé. L'extrapolation est rejetée (NaN) si le dénominateur r^p - 1 est
+        trop faible ou si le temps extrapolé n'est pas positif.
+
+        Args:
+            approche (str): Approche à extrapoler.
+
+        Returns:
+            float: Temps de désorbitation extrapolé à dt -> 0 (en jours, NaN si l'extrapolation est rejetée).
+        """
+        t_grossier, t_moyen, t_fin = self.temps[approche][-3:]
+        r = self.raffinement
+        ecart_grossier = t_grossier - t_moyen
+        ecart_fin = t_moyen - t_fin
+
+        p = self.ordre_formel
+        if ecart_fin != 0 and ecart_grossier / ecart_fin > 0 and abs(ecart_grossier / ecart_fin - 1) > 0.1:
+            p_observe = np.log(ecart_grossier / ecart_fin) / np.log(r)
+            p = float(np.clip(p_observe, self.ordre_formel / 2, self.ordre_formel * 2))
+
+        t_extrapole = np.nan
+        if r ** p - 1 > 1e-3:
+            t_extrapole = t_fin + (t_fin - t_moyen) / (r ** p - 1)
+            if t_extrapole <= 0:
+                t_extrapole = np.nan
+
+        self.ordre[approche] = p
+        self.temps_extrapole[approche] = t_extrapole
+        self.erreurs[approche] = [abs(t - t_extrapole) / abs(t_extrapole) for t in self.temps[approche]]
+        return t_extrapole
+
+    def recommander(self):
+        """
+        Retourne le plus grand pas de temps respectant la tolérance pour chaque approche.
+
+        Returns:
+            dict: Pas de temps recommandé par approche (None si aucun ne respecte la tolérance).
+        """
+        recommandation = {}
+        for approche in self.approches:
+            admissibles = [dt for dt, erreur in zip(self.pas_de_temps, self.erreurs[approche])
+                           if erreur <= self.tolerance]
+            recommandation[approche] = max(admissibles) if admissibles else None
+        return recommandation
+
+    def afficher_resultats(self):
+        """
+        Affiche les temps de désorbitation, les erreurs relatives et le pas de temps recommandé.
+        """
+        recommandation = self.recommander()
+        for approche in self.approches:
+            if np.isnan(self.temps_extrapole[approche]):
+                print(f'Approche {approche} : extrapolation de Richardson rejetée')
+            else:
+                print(f'Approche {approche} (ordre retenu = {self.ordre[approche]:0.2f}, '
+                      f'temps extrapolé = {self.temps_extrapole[approche]:0.4f} jours)')
+            for dt, t, erreur in zip(self.pas_de_temps, self.temps[approche], self.erreurs[approche]):
+                print(f'  dt = {dt:8.2f} s : {t:0.4f} jours, erreur relative = {erreur * 100:0.3f} %')
+            if recommandation[approche] is None:
+                print(f'  Aucun pas de temps ne respecte la tolérance de {self.tolerance * 100:0.2f} %')
+            else:
+                print(f'  Pas de temps recommandé = {recommandation[approche]:0.2f} s')
+
+    def ecrire_scenario(self, file_path, approche):
+        """
+        Écrit un fichier de scénario utilisant le pas de temps recommandé pour une approche.
+
+        Args:
+            file_path (str): Chemin du fichier YAML à écrire.
+            approche (str): Approche dont le pas de temps recommandé est retenu.
+        """
+        dt = self.recommander()[approche]
+        if dt is None:
+            raise ValueError(f"Aucun pas de temps ne respecte la tolérance pour l'approche {approche}")
+        donnees = copy.deepcopy(self.parsed_data)
+        donnees['orbite']['dt'] = float(dt)
+        LecteurYAML(file_path).write_yaml(donnees)
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+from .Constantes import *
+from .Satellite_mag import Satellite_magnetique
+
+
+def calculer_Bt_initial(champ_mag, altitude, inclinaison=0):
+    """
+    Calcule la composante tangente du champ magnétique à l'instant initial d'une simulation.
+
+    Le satellite est placé comme dans Orbite.initialiser_simulation : position (r, 0, 0) et vitesse orientée à
+    pi/2 - inclinaison par rapport au nord.
+
+    Args:
+        champ_mag (Champ_mag): Instance de la classe Champ_mag (ou TableChamp).
+        altitude (float): Altitude initiale de l'orbite en mètres.
+        inclinaison (float, optional): Inclinaison de l'orbite en degrés (par défaut 0).
+
+    Returns:
+        float: Composante tangente du champ magnétique en teslas.
+    """
+    satellite = Satellite_magnetique(0, 0, None)
+    satellite.set_position(r=altitude + rayon_terre)
+    return float(champ_mag.calculer_Bt(satellite, vitesse=np.pi / 2 - inclinaison / 180 * np.pi))
+
+
+def evaluer_conceptions(longueurs, sections, materiaux, ballasts, resistances_de_controle, masse_satellite, altitude,
+                        champ_mag=None, inclinaison=0, inclinaison_alpha=35.26, fraction_masse_max=0.1, Bt=None):
+    """
+    Évalue sans simulation une grille de conceptions de câble et retourne un tableau classé.
+
+    Toutes les combinaisons (longueur, section, matériau, ballast, Rc) sont évaluées en une seule opération
+    NumPy. Les grandeurs calculées reprennent les formules de Cable, de Satellite_magnetique.calculer_Fe et
+    de la limite de puissance fd_max utilisée par Orbite.calculer_temps_desorbitation à l'instant initial.
+    Le champ magnétique ne dépendant pas de la conception, Bt est calculé une seule fois (voir calculer_Bt_initial).
+
+    Args:
+        longueurs (array): Longueurs de câble à tester en mètres.
+        sections (array): Sections de câble à tester en millimètres carrés.
+        materiaux (dict): Matériaux à tester, indexés par leur nom (ex. {'aluminium': Materiau(...)}).
+        ballasts (array): Masses de ballast à tester en kilogrammes.
+        resistances_de_controle (array): Résistances de contrôle à tester en ohms.
+        masse_satellite (float): Masse totale du satellite en kilogrammes.
+        altitude (float): Altitude initiale de l'orbite en mètres.
+        champ_mag (Champ_mag, optional): Modèle de champ magnétique à la date initiale, requis si Bt n'est pas donné.
+        inclinaison (float, optional): Inclinaison de l'orbite en degrés (par défaut 0).
+        inclinaison_alpha (float, optional): L'inclinaison du câble en degrés (par défaut 35.26).
+        fraction_masse_max (float, optional): Fraction maximale de la masse du satellite allouée au câble et
+            au ballast (par défaut 0.1).
+        Bt (float, optional): Composante tangente du champ magnétique à l'instant initial en teslas, remplaçant
+            la valeur calculée à partir de champ_mag.
+
+    Returns:
+        pandas.DataFrame: Conceptions admissibles classées par force électromagnétique décroissante.
+    """
+    if Bt is None:
+        if champ_mag is None:
+            raise ValueError("Un modèle de champ magnétique (champ_mag) ou une valeur de Bt est requis")
+        Bt = calculer_Bt_initial(champ_mag, altitude, inclinaison)
+
+    noms = list(materiaux.keys())
+    densites = np.array([materiaux[nom].densite for nom in noms])
+    resistivites = np.array([materiaux[nom].resistance for nom in noms])
+
+    L, S, k, M_b, Rc = np.meshgrid(np.asarray(longueurs, dtype=float), np.asarray(sections, dtype=float),
+                                   np.arange(len(noms)), np.asarray(ballasts, dtype=float),
+                                   np.asarray(resistances_de_controle, dtype=float), indexing='ij')
+    L, S, k, M_b, Rc = (x.ravel() for x in (L, S, k, M_b, Rc))
+
+    # Caractéristiques du câble (voir Cable.__init__)
+    S = S * 10 ** -6  # mm2 to m2
+    masse_cable = densites[k] * L * S
+    resistance = resistivites[k] / S * L
+    resistance = np.where(resistance == 0, 1, resistance)
+    fraction_masse = (masse_cable + M_b) / masse_satellite
+
+    # Conditions initiales de l'orbite
+    rayon = altitude + rayon_terre
+    vitesse = np.sqrt(mu_terre / rayon)
+    alpha = inclinaison_alpha / 180 * np.pi
+
+    # Force électromagnétique projetée (voir Satellite_magnetique.calculer_Fe)
+    force_mag = -L ** 2 * Bt ** 2 * vitesse * np.cos(alpha) / (resistance + Rc) * np.cos(alpha)
+
+    # Puissance dissipée et limite de puissance fd_max
+    vitesse_par_rapport_ch_mag = vitesse - 2 * np.pi * rayon * np.cos((11.5 + inclinaison) / 180 * np.pi)
+    puissance = force_mag * vitesse_par_rapport_ch_mag
+    gamma = mu_terre / rayon ** 3
+    fd_max = -2.31 * gamma * L * (M_b + masse_cable / 4)
+    puissance_max = fd_max * vitesse_par_rapport_ch_mag
+
+    admissible = (fraction_masse <= fraction_masse_max) & (np.abs(puissance) <= np.abs(puissance_max))
+
+    tableau = pd.DataFrame({
+        'longueur': L,
+        'section': S * 10 ** 6,
+        'materiau': np.array(noms)[k],
+        'ballast_mass': M_b,
+        'resistance_de_controle': Rc,
+        'masse_cable': masse_cable,
+        'resistance': resistance,
+        'fraction_masse': fraction_masse,
+        'force_mag': force_mag,
+        'puissance': puissance,
+        'puissance_max': puissance_max,
+    })[admissible]
+
+    return tableau.sort_values('force_mag', key=np.abs, ascending=False, ignore_index=True)
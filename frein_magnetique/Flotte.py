@@ -0,0 +1,252 @@
+import time
+import numpy as np
+from collections import deque
+from datetime import timedelta
+from .Constantes import *
+from .Orbite import STATUT_DESORBITE, STATUT_TEMPS_SIMU, STATUT_NB_ETAPES, STATUT_DUREE_CALCUL, STATUT_HORS_DOMAINE
+from .TableChamp import TableChamp
+
+
+class Flotte:
+    """
+    Classe simulant la désorbitation de plusieurs satellites dans un seul intégrateur vectorisé.
+
+    Les caractéristiques des satellites (masse, surface de traînée, câble, altitude et inclinaison initiales)
+    sont rangées dans des tableaux NumPy parallèles. À chaque étape, la traînée atmosphérique, la force
+    électromagnétique (voir Satellite_magnetique.calculer_Fe) et la mise à jour du rayon (voir
+    Orbite.calculer_temps_desorbitation) sont calculées pour tous les satellites actifs en une seule
+    opération, avec un seul appel au modèle de champ magnétique. Les satellites ayant atteint 100 km sont
+    retirés de l'ensemble actif.
+
+    Attributs:
+        dt (float): Intervalle de temps entre chaque étape de la simulation.
+        approche (str): Approche utilisée pour les calculs ('energetique' ou 'pfd').
+        temps_simu (float): Durée maximale simulée en secondes (None pour ne pas limiter).
+        nb_etapes_max (int): Nombre maximal d'étapes de calcul (None pour ne pas limiter).
+        duree_calcul_max (float): Durée de calcul maximale en secondes (None pour ne pas limiter).
+        rayon_initial (numpy.ndarray): Rayon initial de l'orbite de chaque satellite en mètres.
+        rayon (numpy.ndarray): Rayon de l'orbite de chaque satellite à la fin de la simulation en mètres.
+        durees_vie (numpy.ndarray): Temps de désorbitation de chaque satellite en jours (NaN si non atteint).
+        durees_vie_estimees (numpy.ndarray): Durée de vie de chaque satellite en jours, extrapolée pour les
+            satellites dont la simulation a été interrompue (voir Orbite.estimer_duree_vie).
+        statuts (list): Raison de la fin de la simulation de chaque satellite.
+    """
+
+    def __init__(self, satellites, orbites, dt=60, approche='energetique', temps_simu=None, nb_etapes_max=None,
+                 duree_calcul_max=None):
+        """
+        Initialise une flotte à partir des satellites et des orbites initiales de chacun de ses membres.
+
+        Args:
+            satellites (list): Instances de la classe Satellite_magnetique.
+            orbites (list): Instances de la classe Orbite donnant l'altitude et l'inclinaison initiales.
+            dt (float, optional): Intervalle de temps entre chaque étape de la simulation (par défaut 60).
+            approche (str, optional): Approche utilisée pour les calculs (par défaut 'energetique').
+            temps_simu (float, optional): Durée maximale simulée en secondes (par défaut aucune limite).
+            nb_etapes_max (int, optional): Nombre maximal d'étapes de calcul (par défaut aucune limite).
+            duree_calcul_max (float, optional): Durée de calcul maximale en secondes (par défaut aucune limite).
+        """
+        self.dt = dt
+        self.approche = approche
+        self.temps_simu = temps_simu
+        self.nb_etapes_max = nb_etapes_max
+        self.duree_calcul_max = duree_calcul_max
+
+        self.masse = np.array([satellite.mass for satellite in satellites], dtype=float)
+        self.surface = np.array([satellite.surface for satellite in satellites], dtype=float)
+        self.cx = np.array([satellite.cx for satellite in satellites], dtype=float)
+        self.longueur_cable = np.array([satellite.cable.longueur_cable for satellite in satellites], dtype=float)
+        self.resistance = np.array([satellite.cable.resistance + satellite.cable.resistance_de_controle
+                                    for satellite in satellites], dtype=float)
+        self.cos_alpha = np.cos([satellite.cable.inclinaison_alpha for satellite in satellites])
+        self.rayon_initial = np.array([orbite.rayon_total for orbite in orbites], dtype=float)
+        self.rayon = self.rayon_initial.copy()
+        self.inclinaison = np.radians([orbite.inclinaison for orbite in orbites])
+
+        self.durees_vie = np.full(len(satellites), np.nan)
+        self.durees_vie_estimees = np.full(len(satellites), np.nan)
+        self.statuts = [None] * len(satellites)
+
+    def calculer_temps_desorbitation(self, atmosphere, champ_mag, nb_etapes=100):
+        """
+        Calcule le temps de désorbitation de tous les satellites de la flotte.
+
+        Args:
+            atmosphere (Atmosphere): Instance de la classe Atmosphere.
+            champ_mag (Champ_mag): Instance de la classe Champ_mag (seule sa méthode calculer_composantes est
+                utilisée). Une TableChamp est remplacée par le modèle de champ qu'elle tabule.
+            nb_etapes (int, optional): Nombre d'étapes utilisées pour estimer la vitesse de descente des satellites
+                dont la simulation est interrompue (par défaut 100, voir Orbite.estimer_duree_vie).
+
+        Returns:
+            numpy.ndarray: Temps de désorbitation de chaque satellite en jours (NaN si la simulation a été
+            interrompue avant, voir les attributs statuts et durees_vie_estimees).
+        """
+        # La table est construite pour une seule orbite : la flotte évalue directement le modèle de champ
+        if isinstance(champ_mag, TableChamp):
+            champ_mag = champ_mag.champ_mag
+
+        densites = np.asarray(atmosphere.densite)
+        actifs = np.arange(len(self.rayon_initial))
+        self.rayon = self.rayon_initial.copy()
+        self.durees_vie = np.full(len(actifs), np.nan)
+        self.durees_vie_estimees = np.full(len(actifs), np.nan)
+        self.statuts = [None] * len(actifs)
+        historique = deque(maxlen=nb_etapes + 1)
+
+        # Conditions initiales (voir Orbite.calculer_temps_desorbitation)
+        rayon = self.rayon_initial.copy()
+        vitesse = np.sqrt(mu_terre / rayon)
+        equateur = np.zeros_like(rayon)
+        theta = np.zeros_like(rayon)
+        phi = np.zeros_like(rayon)
+        Bt = self.calculer_Bt(champ_mag, rayon, theta, phi, np.pi / 2 - self.inclinaison, 0)
+
+        temps = 0
+        i = 0
+        debut_calcul = time.monotonic()
+        while len(actifs):
+            # Rayons des dernières étapes, pour l'estimation de la durée de vie des satellites interrompus
+            self.rayon[actifs] = rayon
+            historique.append((temps, self.rayon.copy()))
+
+            # Retrait des satellites désorbités ou hors du domaine de la table de densité
+            indice_densite = ((rayon - rayon_terre) // 1000).astype(int)
+            desorbite = rayon <= (100000 + rayon_terre)
+            hors_domaine = ~desorbite & ((indice_densite < 0) | (indice_densite >= len(densites)))
+            if desorbite.any() or hors_domaine.any():
+                self.retirer(actifs[desorbite], STATUT_DESORBITE, temps)
+                self.retirer(actifs[hors_domaine], STATUT_HORS_DOMAINE, None, historique)
+                garder = ~(desorbite | hors_domaine)
+                actifs, rayon, vitesse, equateur, theta, phi, Bt, indice_densite = (
+                    x[garder] for x in (actifs, rayon, vitesse, equateur, theta, phi, Bt, indice_densite))
+                if not len(actifs):
+                    break
+
+            statut = self.verifier_budgets(temps, i, debut_calcul)
+            if statut is not None:
+                self.retirer(actifs, statut, None, historique)
+                break
+
+            masse = self.masse[actifs]
+
+            # Forces de traînée atmosphérique et électromagnétique
+            force_trainee = 0.5 * densites[indice_densite] * self.surface[actifs] * vitesse ** 2 * self.cx[actifs]
+            cos_alpha = self.cos_alpha[actifs]
+            force_mag = -self.longueur_cable[actifs] ** 2 * Bt ** 2 * vitesse * cos_alpha / self.resistance[actifs] \
+                * cos_alpha
+            somme_forces = force_trainee - force_mag
+
+            if self.approche == 'energetique':
+                k1 = - 2 / (mu_terre * masse) * rayon ** 2 * somme_forces * vitesse
+                k2 = - 2 / (mu_terre * masse) * (rayon + k1 * self.dt) ** 2 * somme_forces * vitesse
+                nouveau_rayon = rayon + (k1 + k2) * self.dt / 2
+                nouvelle_vitesse = np.sqrt(mu_terre / nouveau_rayon)
+            elif self.approche == 'pfd':
+                nouvelle_vitesse = vitesse + somme_forces / masse * self.dt
+                nouveau_rayon = mu_terre / nouvelle_vitesse ** 2
+            else:
+                raise ValueError(f"Approche inconnue : {self.approche}")
+
+            equateur = equateur + np.arctan2(vitesse * self.dt, rayon)
+            rayon, vitesse = nouveau_rayon, nouvelle_vitesse
+            temps += self.dt
+            i += 1
+
+            # Position sur l'orbite inclinée (voir Satellite_magnetique.update_etat)
+            inclinaison = self.inclinaison[actifs]
+            nouveau_theta = np.arcsin(np.sin(equateur) * np.sin(inclinaison))
+            nouveau_phi = np.arctan2(np.sin(equateur) * np.cos(inclinaison), np.cos(equateur))
+            angle_nord_vitesse = np.arctan2(nouveau_phi - phi, nouveau_theta - theta)
+            theta, phi = nouveau_theta, nouveau_phi
+
+            Bt = self.calculer_Bt(champ_mag, rayon, theta, phi, angle_nord_vitesse, temps)
+
+        self.rayon[actifs] = rayon
+        return self.durees_vie
+
+    def calculer_Bt(self, champ_mag, rayon, theta, phi, angle_nord_vitesse, temps):
+        """
+        Calcule la composante tangente du champ magnétique pour tous les satellites actifs (voir Champ_mag.calculer_Bt).
+
+        Args:
+            champ_mag (Champ_mag): Instance de la classe Champ_mag.
+            rayon (numpy.ndarray): Rayons des orbites en mètres.
+            theta (numpy.ndarray): Latitudes en radians.
+            phi (numpy.ndarray): Longitudes en radians.
+            angle_nord_vitesse (numpy.ndarray): Angles entre la vitesse et le nord en radians.
+            temps (float): Temps écoulé depuis la date initiale en secondes.
+
+        Returns:
+            numpy.ndarray: Composante tangente du champ magnétique en Tesla.
+        """
+        date = champ_mag.date + timedelta(temps // (24 * 3600))
+        longitude = np.degrees(phi)
+        longitude = np.where(longitude >= 180, longitude - 360, longitude)
+        be, bn, bu = champ_mag.calculer_composantes((rayon - rayon_terre) // 1000, np.degrees(theta), longitude, date)
+        be = np.ravel(be) / 10 ** 9
+        bn = np.ravel(bn) / 10 ** 9
+        return bn * np.sin(angle_nord_vitesse) + be * np.cos(angle_nord_vitesse)
+
+    def verifier_budgets(self, temps, i, debut_calcul):
+        """
+        Vérifie si la simulation de la flotte doit être interrompue (voir Orbite.verifier_budgets).
+
+        Args:
+            temps (float): Temps simulé en secondes.
+            i (int): Nombre d'étapes calculées.
+            debut_calcul (float): Instant de début du calcul (time.monotonic).
+
+        Returns:
+            str: Statut d'interruption, ou None si la simulation peut continuer.
+        """
+        if self.temps_simu is not None and temps >= self.temps_simu:
+            return STATUT_TEMPS_SIMU
+        if self.nb_etapes_max is not None and i >= self.nb_etapes_max:
+            return STATUT_NB_ETAPES
+        if self.duree_calcul_max is not None and time.monotonic() - debut_calcul >= self.duree_calcul_max:
+            return STATUT_DUREE_CALCUL
+        return None
+
+    def retirer(self, indices, statut, temps, historique=None):
+        """
+        Retire des satellites de l'ensemble actif.
+
+        Args:
+            indices (numpy.ndarray): Indices des satellites retirés.
+            statut (str): Raison du retrait.
+            temps (float): Temps de désorbitation en secondes (None si le satellite n'a pas atteint 100 km).
+            historique (deque, optional): Couples (temps, rayons) des dernières étapes, utilisés pour estimer la
+                durée de vie des satellites n'ayant pas atteint 100 km.
+        """
+        for indice in indices:
+            self.statuts[indice] = statut
+        if temps is not None:
+            self.durees_vie[indices] = temps / (24 * 3600)
+            self.durees_vie_estimees[indices] = temps / (24 * 3600)
+        elif historique is not None:
+            self.durees_vie_estimees[indices] = self.estimer_duree_vie(indices, historique)
+
+    def estimer_duree_vie(self, indices, historique):
+        """
+        Estime la durée de vie de satellites interrompus avant 100 km (voir Orbite.estimer_duree_vie).
+
+        La vitesse de descente moyenne sur les étapes de l'historique est extrapolée linéairement jusqu'à 100 km.
+
+        Args:
+            indices (numpy.ndarray): Indices des satellites.
+            historique (deque): Couples (temps, rayons) des dernières étapes, de la plus ancienne à la plus récente.
+
+        Returns:
+            numpy.ndarray: Durée de vie en jours (inf si l'orbite ne descend pas, NaN si aucune étape n'a été calculée).
+        """
+        temps_debut, rayon_debut = historique[0]
+        temps_fin, rayon_fin = historique[-1]
+        if temps_fin == temps_debut:
+            return np.full(len(indices), np.nan)
+
+        vitesse_descente = (rayon_debut[indices] - rayon_fin[indices]) / (temps_fin - temps_debut)
+        temps_restant = np.full(len(indices), np.inf)
+        descend = vitesse_descente > 0
+        temps_restant[descend] = (rayon_fin[indices][descend] - (100000 + rayon_terre)) / vitesse_descente[descend]
+        return (temps_fin + temps_restant) / (24 * 3600)
@@ -8,4 +8,10 @@ class LecteurYAML:
                 data = yaml.safe_load(file)
                 return data
             except yaml.YAMLError as e:
-                print(f"Error reading YAML file: {e}")
\ No newline at end of file
+                print(f"Error reading YAML file: {e}")
+    def write_yaml(self, data, file_path=None):
+        # Les commentaires du fichier d'origine ne sont pas conservés
+        if file_path is None:
+            file_path = self.file_path
+        with open(file_path, 'w') as file:
+            yaml.safe_dump(data, file, sort_keys=False, allow_unicode=True)
@@ -0,0 +1,213 @@
+import time
+from tqdm import tqdm
+from .Constantes import *
+
+
+def progression_desorbitation(orbite, i):
+    """
+    Calcule la fraction de la désorbitation effectuée, de l'altitude initiale jusqu'à 100 km.
+
+    Args:
+        orbite (Orbite): Orbite en cours de simulation.
+        i (int): Indice de l'étape courante.
+
+    Returns:
+        float: Fraction de la désorbitation effectuée, entre 0 et 1.
+    """
+    altitude_initiale = orbite.rayon[0] - rayon_terre - 100000
+    if altitude_initiale <= 0:
+        return 1.0
+    altitude = orbite.rayon[i] - rayon_terre - 100000
+    return min(max(1 - altitude / altitude_initiale, 0.0), 1.0)
+
+
+class Observateur:
+    """
+    Classe de base des observateurs attachés à une orbite pendant la simulation.
+
+    Les sous-classes redéfinissent les méthodes debut, etape et fin. La méthode etape n'est appelée
+    que toutes les `periode` étapes et au plus une fois toutes les `intervalle` secondes.
+
+    Attributs:
+        periode (int): Nombre d'étapes entre deux notifications.
+        intervalle (float): Durée minimale en secondes entre deux notifications (0 pour ne pas limiter).
+    """
+
+    def __init__(self, periode=1, intervalle=0.0):
+        """
+        Initialise un observateur.
+
+        Args:
+            periode (int, optional): Nombre d'étapes entre deux notifications (par défaut 1).
+            intervalle (float, optional): Durée minimale en secondes entre deux notifications (par défaut 0).
+        """
+        self.periode = periode
+        self.intervalle = intervalle
+        self._derniere_notification = 0.0
+
+    def doit_notifier(self, i):
+        """
+        Indique si l'observateur doit être notifié à l'étape i.
+
+        Args:
+            i (int): Indice de l'étape courante.
+
+        Returns:
+            bool: True si la méthode etape doit être appelée.
+        """
+        if i % self.periode:
+            return False
+        if self.intervalle:
+            maintenant = time.monotonic()
+            if maintenant - self._derniere_notification < self.intervalle:
+                return False
+            self._derniere_notification = maintenant
+        return True
+
+    def debut(self, orbite):
+        """
+        Appelée avant la première étape de la simulation.
+
+        Args:
+            orbite (Orbite): Orbite en cours de simulation.
+        """
+
+    def etape(self, orbite, i):
+        """
+        Appelée après le calcul de l'étape i.
+
+        Args:
+            orbite (Orbite): Orbite en cours de simulation.
+            i (int): Indice de l'étape courante dans orbite.temps et orbite.rayon.
+        """
+
+    def fin(self, orbite):
+        """
+        Appelée à la fin de la simulation.
+
+        Args:
+            orbite (Orbite): Orbite simulée.
+        """
+
+
+class BarreProgression(Observateur):
+    """
+    Observateur affichant une barre de progression en kilomètres d'altitude perdus jusqu'à 100 km.
+    """
+
+    def __init__(self, periode=1, intervalle=0.1):
+        """
+        Initialise la barre de progression.
+
+        Args:
+            periode (int, optional): Nombre d'étapes entre deux mises à jour (par défaut 1).
+            intervalle (float, optional): Durée minimale en secondes entre deux mises à jour (par défaut 0.1).
+        """
+        super().__init__(periode, intervalle)
+        self.pbar = None
+
+    def debut(self, orbite):
+        self.pbar = tqdm(total=(orbite.rayon[0] - rayon_terre) // 1000 - 100, colour='blue')
+
+    def etape(self, orbite, i):
+        progression = min(self.pbar.total - ((orbite.rayon[i] - rayon_terre) // 1000 - 100), self.pbar.total)
+        if progression > self.pbar.n:
+            self.pbar.update(progression - self.pbar.n)
+
+    def fin(self, orbite):
+        self.etape(orbite, len(orbite.rayon) - 1)
+        self.pbar.close()
+
+
+class ObservateurAgrege(Observateur):
+    """
+    Observateur transmettant la progression d'une simulation à une ProgressionAgregee.
+
+    Attributs:
+        etat (dict): Dictionnaire partagé des progressions, indexé par nom de simulation.
+        nom (str): Nom de la simulation observée.
+    """
+
+    def __init__(self, etat, nom, periode=1, intervalle=0.5):
+        """
+        Initialise l'observateur.
+
+        Args:
+            etat (dict): Dictionnaire partagé des progressions (dict ou multiprocessing.Manager().dict()).
+            nom (str): Nom de la simulation observée.
+            periode (int, optional): Nombre d'étapes entre deux mises à jour (par défaut 1).
+            intervalle (float, optional): Durée minimale en secondes entre deux mises à jour (par défaut 0.5).
+        """
+        super().__init__(periode, intervalle)
+        self.etat = etat
+        self.nom = nom
+
+    def debut(self, orbite):
+        self.etat[self.nom] = 0.0
+
+    def etape(self, orbite, i):
+        self.etat[self.nom] = progression_desorbitation(orbite, i)
+
+    def fin(self, orbite):
+        self.etat[self.nom] = 1.0
+
+
+class ProgressionAgregee:
+    """
+    Regroupe la progression de plusieurs simulations concurrentes dans un seul rapport.
+
+    Pour des simulations exécutées dans d'autres processus, l'état doit être un dictionnaire partagé
+    créé par multiprocessing.Manager().dict().
+
+    Attributs:
+        etat (dict): Progression de chaque simulation, entre 0 et 1, indexée par nom.
+    """
+
+    def __init__(self, etat=None):
+        """
+        Initialise le suivi de progression.
+
+        Args:
+            etat (dict, optional): Dictionnaire partagé des progressions (par défaut un dictionnaire local).
+        """
+        if etat is None:
+            etat = {}
+        self.etat = etat
+
+    def observateur(self, nom, periode=1, intervalle=0.5):
+        """
+        Crée un observateur à attacher à l'orbite d'une simulation.
+
+        Args:
+            nom (str): Nom de la simulation.
+            periode (int, optional): Nombre d'étapes entre deux mises à jour (par défaut 1).
+            intervalle (float, optional): Durée minimale en secondes entre deux mises à jour (par défaut 0.5).
+
+        Returns:
+            ObservateurAgrege: L'observateur de la simulation.
+        """
+        self.etat[nom] = 0.0
+        return ObservateurAgrege(self.etat, nom, periode, intervalle)
+
+    def rapport(self):
+        """
+        Calcule un résumé de la progression de toutes les simulations.
+
+        Returns:
+            dict: Nombre de simulations, nombre de simulations terminées et progression moyenne.
+        """
+        progressions = dict(self.etat)
+        nombre = len(progressions)
+        return {
+            'simulations': nombre,
+            'terminees': sum(1 for p in progressions.values() if p >= 1.0),
+            'progression': sum(progressions.values()) / nombre if nombre else 0.0,
+        }
+
+    def afficher_rapport(self):
+        """
+        Affiche le résumé de la progression sur une ligne.
+        """
+        rapport = self.rapport()
+        print(f"Simulations terminées : {rapport['terminees']}/{rapport['simulations']}, "
+              f"progression globale = {rapport['progression'] * 100:0.1f} %")
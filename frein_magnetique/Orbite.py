@@ -1,7 +1,14 @@
 from .Constantes import *
+import time
 import numpy as np
 import matplotlib.pyplot as plt
-from tqdm import tqdm
+
+# Statuts de fin de simulation
+STATUT_DESORBITE = 'desorbite'
+STATUT_TEMPS_SIMU = 'temps_simu'
+STATUT_NB_ETAPES = 'nb_etapes_max'
+STATUT_DUREE_CALCUL = 'duree_calcul_max'
+STATUT_HORS_DOMAINE = 'hors_domaine'
 
 class Orbite:
     """
@@ -12,15 +19,27 @@ class Orbite:
         puissances (list): Liste des puissances calculées lors de la simulation.
         rayon (list): Liste des rayons de l'orbite à différents instants.
         temps (list): Liste des temps de la simulation.
+        vitesse (list): Liste des vitesses du satellite à différents instants.
         rayon_total (float): Rayon total de l'orbite (altitude + rayon de la Terre).
         dt (float): Intervalle de temps entre chaque étape de la simulation.
         inclinaison (float): Inclinaison de l'orbite en degrés.
-        temps_simu (float): Durée totale de la simulation en secondes.
+        temps_simu (float): Durée maximale simulée en secondes (None pour ne pas limiter).
+        nb_etapes_max (int): Nombre maximal d'étapes de calcul (None pour ne pas limiter).
+        duree_calcul_max (float): Durée de calcul maximale en secondes (None pour ne pas limiter).
         approche (str): Approche utilisée pour les calculs ('energetique' ou 'pfd').
+        observateurs (list): Observateurs notifiés pendant la simulation.
+        statut (str): Raison de la fin de la simulation (STATUT_DESORBITE si le satellite a atteint 100 km).
+        duree_vie_estimee (float): Durée de vie du satellite en jours, extrapolée si la simulation a été interrompue.
 
     Méthodes:
-        __init__(self, h, inclinaison=0, dt=1000, temps_simu=800000): Initialise une instance de la classe Orbite.
+        __init__(self, h, inclinaison=0, dt=1000, temps_simu=None, nb_etapes_max=None, duree_calcul_max=None, observateurs=None): Initialise une instance de la classe Orbite.
+        ajouter_observateur(self, observateur): Attache un observateur à la simulation.
         calculer_temps_desorbitation(self, satellite, atmosphere, champ_mag, approche): Calcule le temps de désorbitation du satellite.
+        initialiser_simulation(self, satellite, atmosphere, champ_mag, approche): Initialise la simulation pas à pas.
+        avancer(self): Calcule une étape de la simulation.
+        terminer_simulation(self): Termine la simulation pas à pas et calcule les résultats.
+        verifier_budgets(self, i, atmosphere, debut_calcul): Vérifie si la simulation doit être interrompue.
+        estimer_duree_vie(self): Extrapole la durée de vie du satellite à partir de la trajectoire calculée.
         calculer_vitesse_kepler(self, h): Calcule la vitesse selon la loi de Kepler pour un rayon donné.
         caluler_trainee(self, atmosphere, satellite, vitesse): Calcule la force de traînée atmosphérique sur le satellite.
         dr_dt(self, satellite, vitesse, force): Calcule le taux de changement de rayon de l'orbite.
@@ -30,7 +49,8 @@ class Orbite:
         save_data(self, filename): Sauvegarde les données de simulation dans un fichier.
     """
 
-    def __init__(self, h, inclinaison=0, dt=1000, temps_simu=800000):
+    def __init__(self, h, inclinaison=0, dt=1000, temps_simu=None, nb_etapes_max=None, duree_calcul_max=None,
+                 observateurs=None):
         """
         Initialise une instance de la classe Orbite.
 
@@ -38,8 +58,13 @@ class Orbite:
             h (float): Altitude initiale de l'orbite en mètres.
             inclinaison (float): Inclinaison de l'orbite en degrés.
             dt (float): Intervalle de temps entre chaque étape de la simulation.
-            temps_simu (float): Durée totale de la simulation en secondes.
+            temps_simu (float, optional): Durée maximale simulée en secondes (par défaut aucune limite).
+            nb_etapes_max (int, optional): Nombre maximal d'étapes de calcul (par défaut aucune limite).
+            duree_calcul_max (float, optional): Durée de calcul maximale en secondes (par défaut aucune limite).
+            observateurs (list, optional): Observateurs notifiés pendant la simulation (par défaut aucun).
         """
+        if observateurs is None:
+            observateurs = []
         self.puissances = None
         self.rayon = []
         self.temps = []
@@ -47,12 +72,30 @@ class Orbite:
         self.dt = dt
         self.inclinaison = inclinaison
         self.temps_simu = temps_simu
+        self.nb_etapes_max = nb_etapes_max
+        self.duree_calcul_max = duree_calcul_max
         self.approche = None
+        self.observateurs = list(observateurs)
+        self.statut = None
+        self.duree_vie_estimee = None
+
+    def ajouter_observateur(self, observateur):
+        """
+        Attache un observateur à la simulation.
+
+        Args:
+            observateur (Observateur): Observateur notifié au début, à chaque étape et à la fin de la simulation.
+        """
+        self.observateurs.append(observateur)
 
     def calculer_temps_desorbitation(self, satellite, atmosphere, champ_mag, approche):
         """
         Calcule le temps de désorbitation du satellite.
 
+        La simulation s'arrête lorsque le satellite atteint 100 km, lorsqu'un budget (temps simulé, nombre d'étapes,
+        durée de calcul) est épuisé ou lorsque l'altitude sort du domaine de la table de densité de l'atmosphère.
+        La raison de l'arrêt est indiquée par l'attribut statut et la trajectoire partielle est conservée.
+
         Args:
             satellite (Satellite): Instance de la classe Satellite_magnetique.
             atmosphere (Atmosphere): Instance de la classe Atmosphere.
@@ -60,85 +103,181 @@ class Orbite:
             approche (str): Approche utilisée pour les calculs ('energetique' ou 'pfd').
 
         Returns:
-            float: Temps de désorbitation en jours.
+            float: Temps de désorbitation en jours, ou temps simulé si la simulation a été interrompue.
+        """
+        self.initialiser_simulation(satellite, atmosphere, champ_mag, approche)
+        while self.avancer():
+            pass
+        return self.terminer_simulation()
+
+    def initialiser_simulation(self, satellite, atmosphere, champ_mag, approche):
+        """
+        Initialise la simulation pas à pas de la désorbitation du satellite.
+
+        Args:
+            satellite (Satellite): Instance de la classe Satellite_magnetique.
+            atmosphere (Atmosphere): Instance de la classe Atmosphere.
+            champ_mag (Champ_mag): Instance de la classe Champ_mag.
+            approche (str): Approche utilisée pour les calculs ('energetique' ou 'pfd').
         """
         # Initialisation des variables
-        nouvelle_vitesse = None
-        nouveau_rayon = None
         self.approche = approche
-        vitesse = []
-        theta = [0]
-        puissance = [0]
-        puissance_max = [0]
+        self.satellite = satellite
+        self.atmosphere = atmosphere
+        self.champ_mag = champ_mag
+        self.statut = None
+        self.vitesse = []
+        self.theta = [0]
+        self.puissance = [0]
+        self.puissance_max = [0]
 
         # Conditions de position initiales
         satellite.set_position(r=self.rayon_total)
         self.rayon.append(self.rayon_total)
 
         # Conditions de vitesse initiale
-        vitesse.append(self.calculer_vitesse_kepler(self.rayon_total))
+        self.vitesse.append(self.calculer_vitesse_kepler(self.rayon_total))
         self.temps.append(0)
 
         # Autres conditions positions initiales
-        equateur = 0
+        self.equateur = 0
         angle_nord_vitesse_initiale = np.pi / 2 - self.inclinaison / 180 * np.pi
-        Bt = champ_mag.calculer_Bt(satellite, vitesse=angle_nord_vitesse_initiale)
+        self.Bt = champ_mag.calculer_Bt(satellite, vitesse=angle_nord_vitesse_initiale)
 
-        i = 0
+        self.i = 0
+        for observateur in self.observateurs:
+            observateur.debut(self)
+        self.debut_calcul = time.monotonic()
+
+    def avancer(self):
+        """
+        Calcule une étape de la simulation initialisée par initialiser_simulation.
+
+        Returns:
+            bool: True si une étape a été calculée, False si la simulation est terminée (voir l'attribut statut).
+        """
+        i = self.i
+        satellite = self.satellite
+        vitesse = self.vitesse
 
         # Tant que le satellite n'atteint pas 100 km
-        pbar = tqdm(total=(self.rayon[0] - rayon_terre) // 1000 - 100, colour='blue')
-        progress = (self.rayon[0] - rayon_terre) // 1000 - 100
-        while self.rayon[i] > (100000 + rayon_terre):
-            force_trainee = self.caluler_trainee(atmosphere, satellite, vitesse[i])
-            # Calcul force mag
-            force_mag = satellite.calculer_Fe(Bt, vitesse[i], Rc=satellite.cable.resistance_de_controle) * np.cos(
-                satellite.cable.inclinaison_alpha)
-            forces = [force_trainee, -force_mag]
+        if self.rayon[i] <= (100000 + rayon_terre):
+            self.statut = STATUT_DESORBITE
+            return False
+        if (statut := self.verifier_budgets(i, self.atmosphere, self.debut_calcul)) is not None:
+            self.statut = statut
+            return False
+
+        force_trainee = self.caluler_trainee(self.atmosphere, satellite, vitesse[i])
+        # Calcul force mag
+        force_mag = satellite.calculer_Fe(self.Bt, vitesse[i], Rc=satellite.cable.resistance_de_controle) * np.cos(
+            satellite.cable.inclinaison_alpha)
+        forces = [force_trainee, -force_mag]
 
-            if self.approche == 'energetique':
-                k1 = self.dr_dt(satellite, vitesse[i], forces)
-                satellite.set_position(r=self.rayon[i] + k1 * self.dt)
-                k2 = self.dr_dt(satellite, vitesse[i], forces)
-                nouveau_rayon = self.rayon[i] + (k1 + k2) * self.dt / 2
-                nouvelle_vitesse = self.calculer_vitesse_kepler(nouveau_rayon)
-            elif self.approche == 'pfd':
-                nouvelle_vitesse = vitesse[i] + sum(forces) / satellite.mass * self.dt
-                nouveau_rayon = mu_terre / nouvelle_vitesse ** 2
+        nouvelle_vitesse = None
+        nouveau_rayon = None
+        if self.approche == 'energetique':
+            k1 = self.dr_dt(satellite, vitesse[i], forces)
+            satellite.set_position(r=self.rayon[i] + k1 * self.dt)
+            k2 = self.dr_dt(satellite, vitesse[i], forces)
+            nouveau_rayon = self.rayon[i] + (k1 + k2) * self.dt / 2
+            nouvelle_vitesse = self.calculer_vitesse_kepler(nouveau_rayon)
+        elif self.approche == 'pfd':
+            nouvelle_vitesse = vitesse[i] + sum(forces) / satellite.mass * self.dt
+            nouveau_rayon = mu_terre / nouvelle_vitesse ** 2
+
+        vitesse.append(nouvelle_vitesse)
+        self.rayon.append(nouveau_rayon)
 
-            vitesse.append(nouvelle_vitesse)
-            self.rayon.append(nouveau_rayon)
+        angle = np.atan2(vitesse[i] * self.dt, self.rayon[i])
+        self.equateur += angle
 
-            if (delta_progression := progress - ((self.rayon[i + 1] - rayon_terre) // 1000 - 100)) > 0:
-                progress -= delta_progression
-                pbar.update(delta_progression)
+        satellite.set_position(r=self.rayon[i + 1])
+        satellite.update_etat(self.equateur, self.inclinaison)
 
-            angle = np.atan2(vitesse[i] * self.dt, self.rayon[i])
-            equateur += angle
+        self.Bt = self.champ_mag.calculer_Bt(satellite, dt=self.dt)
 
-            satellite.set_position(r=self.rayon[i + 1])
-            satellite.update_etat(equateur, self.inclinaison)
+        vitesse_par_rapport_ch_mag = vitesse[i + 1] - 2 * np.pi * self.rayon[i + 1] * np.cos(
+            (11.5 + self.inclinaison) / 180 * np.pi)
+        self.puissance.append(force_mag * vitesse_par_rapport_ch_mag)
 
-            Bt = champ_mag.calculer_Bt(satellite, dt=self.dt)
+        gamma = mu_terre / self.rayon[i + 1] ** 3
+        fd_max = -2.31 * gamma * satellite.cable.longueur_cable * (
+                satellite.cable.mass_ballast + satellite.cable.mass / 4)
+        self.puissance_max.append(fd_max * vitesse_par_rapport_ch_mag)
 
-            vitesse_par_rapport_ch_mag = vitesse[i + 1] - 2 * np.pi * self.rayon[i + 1] * np.cos(
-                (11.5 + self.inclinaison) / 180 * np.pi)
-            puissance.append(force_mag * vitesse_par_rapport_ch_mag)
+        self.temps.append(self.temps[i] + self.dt)
+        self.theta.append(satellite.get_theta())
 
-            gamma = mu_terre / self.rayon[i + 1] ** 3
-            fd_max = -2.31 * gamma * satellite.cable.longueur_cable * (
-                    satellite.cable.mass_ballast + satellite.cable.mass / 4)
-            puissance_max.append(fd_max * vitesse_par_rapport_ch_mag)
+        self.i = i = i + 1
 
-            self.temps.append(self.temps[i] + self.dt)
-            theta.append(satellite.get_theta())
+        if self.observateurs:
+            for observateur in self.observateurs:
+                if observateur.doit_notifier(i):
+                    observateur.etape(self, i)
+        return True
 
-            i += 1
+    def terminer_simulation(self):
+        """
+        Termine la simulation pas à pas et calcule les résultats.
 
-        pbar.close()
-        self.puissances = [puissance[1:], puissance_max[1:]]
+        Returns:
+            float: Temps de désorbitation en jours, ou temps simulé si la simulation a été interrompue.
+        """
+        for observateur in self.observateurs:
+            observateur.fin(self)
+        self.puissances = [self.puissance[1:], self.puissance_max[1:]]
+        self.duree_vie_estimee = self.estimer_duree_vie()
         return self.temps[-1] / (24 * 3600)
 
+    def verifier_budgets(self, i, atmosphere, debut_calcul):
+        """
+        Vérifie si la simulation doit être interrompue avant de calculer l'étape i.
+
+        Args:
+            i (int): Indice de l'étape courante.
+            atmosphere (Atmosphere): Instance de la classe Atmosphere.
+            debut_calcul (float): Instant de début du calcul (time.monotonic).
+
+        Returns:
+            str: Statut d'interruption, ou None si la simulation peut continuer.
+        """
+        if not 0 <= int(self.rayon[i] - rayon_terre) // 1000 < len(atmosphere.densite):
+            return STATUT_HORS_DOMAINE
+        if self.temps_simu is not None and self.temps[i] >= self.temps_simu:
+            return STATUT_TEMPS_SIMU
+        if self.nb_etapes_max is not None and i >= self.nb_etapes_max:
+            return STATUT_NB_ETAPES
+        if self.duree_calcul_max is not None and time.monotonic() - debut_calcul >= self.duree_calcul_max:
+            return STATUT_DUREE_CALCUL
+        return None
+
+    def estimer_duree_vie(self, nb_etapes=100):
+        """
+        Estime la durée de vie du satellite à partir de la trajectoire calculée.
+
+        Si le satellite a atteint 100 km, la durée de vie est le temps simulé. Sinon, la vitesse de descente
+        moyenne des dernières étapes est extrapolée linéairement jusqu'à 100 km. La densité de l'atmosphère
+        augmentant à mesure que l'orbite descend, cette estimation est majorante.
+
+        Args:
+            nb_etapes (int, optional): Nombre d'étapes utilisées pour estimer la vitesse de descente (par défaut 100).
+
+        Returns:
+            float: Durée de vie en jours (inf si l'orbite ne descend pas, None si aucune étape n'a été calculée).
+        """
+        if self.statut == STATUT_DESORBITE:
+            return self.temps[-1] / (24 * 3600)
+        if len(self.temps) < 2:
+            return None
+
+        debut = max(len(self.temps) - 1 - nb_etapes, 0)
+        vitesse_descente = (self.rayon[debut] - self.rayon[-1]) / (self.temps[-1] - self.temps[debut])
+        if vitesse_descente <= 0:
+            return np.inf
+        temps_restant = (self.rayon[-1] - (100000 + rayon_terre)) / vitesse_descente
+        return (self.temps[-1] + temps_restant) / (24 * 3600)
+
     def calculer_vitesse_kepler(self, h):
         """
         Calcule la vitesse selon la loi de Kepler pour un rayon donné.
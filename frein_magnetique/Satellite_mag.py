@@ -76,6 +76,7 @@ class Satellite_magnetique(Satellite):
         cable (Cable): Le câble utilisé par le satellite.
         position (list): La position du satellite en coordonnées sphériques [r, theta, phi].
         angle_nord_vitesse (float): L'angle entre la vitesse et le nord.
+        argument_latitude (float): La position sur l'orbite depuis le noeud ascendant en radians.
     """
 
     def __init__(self, mass, cross_surface, cable, position=None, cx=2):
@@ -94,6 +95,7 @@ class Satellite_magnetique(Satellite):
             position = [0, 0, 0]
         self.__position = position #r, theta, phi
         self.angle_nord_vitesse = 0
+        self.argument_latitude = 0
         self.cable = cable
     def calculer_Fe(self, Bt, Vo, Rc=0):
         """
@@ -162,6 +164,7 @@ class Satellite_magnetique(Satellite):
             inclinaison_orbite (float): L'inclinaison de l'orbite en degrés.
         """
         old_position = self.__position
+        self.argument_latitude = position_sur_equateur
         x, y, z = cs.sp2cart(old_position[0], 0, position_sur_equateur)
         matrice_de_rotation = cs.mx_rot_x(inclinaison_orbite / 180 * pi)
         x, y, z = cs.mx_apply(matrice_de_rotation, x, y, z)
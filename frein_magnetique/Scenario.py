@@ -0,0 +1,76 @@
+"""
+Ce module permet de construire les objets d'une simulation à partir des paramètres lus dans un fichier YAML.
+
+Fonctions:
+    - construire_materiau(nom): Retourne le matériau correspondant au nom indiqué dans le fichier YAML.
+    - construire_scenario(parsed_data, atmosphere=None, dt=None): Crée l'orbite, le satellite et le champ magnétique.
+"""
+
+from datetime import datetime
+from .Constantes import *
+from .Materiau import Materiau
+from .Satellite_mag import Cable, Satellite_magnetique
+from .Orbite import Orbite
+from .Champ_magnetique import Champ_mag
+from .TableChamp import TableChamp
+from .Atmopshere import Atmosphere
+
+
+def construire_materiau(nom='aluminium'):
+    """
+    Retourne le matériau correspondant au nom indiqué dans le fichier YAML.
+
+    Args:
+        nom (str): Nom du matériau ('aluminium' ou 'cuivre', par défaut 'aluminium').
+
+    Returns:
+        Materiau: Le matériau du câble.
+    """
+    if nom == 'cuivre':
+        return Materiau(densite_cuivre, resistance_linéaire_cuivre)
+    elif nom == 'aluminium':
+        return Materiau(densite_alu, resistance_linéaire_alu)
+    raise ValueError(f"Matériau inconnu : {nom}")
+
+
+def construire_scenario(parsed_data, atmosphere=None, dt=None):
+    """
+    Crée les objets nécessaires à une simulation à partir des paramètres du fichier YAML.
+
+    Args:
+        parsed_data (dict): Paramètres de simulation lus par LecteurYAML.
+        atmosphere (Atmosphere, optional): Atmosphère à réutiliser (par défaut une nouvelle instance est créée).
+        dt (float, optional): Pas de temps remplaçant celui du fichier YAML.
+
+    Returns:
+        tuple: (orbite, satellite, atmosphere, champ_mag).
+    """
+    donnees_orbite = parsed_data['orbite']
+    donnees_satellite = parsed_data['satelitte_magnetique']
+    donnees_cable = donnees_satellite['cable']
+    donnees_date = parsed_data['date']
+    donnees_champ = parsed_data.get('champ_magnetique', {})
+
+    if dt is None:
+        dt = donnees_orbite['dt']
+    if atmosphere is None:
+        atmosphere = Atmosphere()
+
+    materiau = construire_materiau(donnees_cable.get('materiau', 'aluminium'))
+    cable = Cable(donnees_cable['longueur'], donnees_cable['section'], materiau,
+                  mass_ballast=donnees_cable['ballast_mass'], Rc=donnees_cable['resistance_de_controle'])
+    satellite = Satellite_magnetique(donnees_satellite['masse'], donnees_satellite['surface_de_trainee'], cable)
+    orbite = Orbite(donnees_orbite['altitude'], donnees_orbite['inclinaison'], dt=dt,
+                    temps_simu=donnees_orbite.get('temps_simu'), nb_etapes_max=donnees_orbite.get('nb_etapes_max'),
+                    duree_calcul_max=donnees_orbite.get('duree_calcul_max'))
+
+    date = datetime(donnees_date['year'], donnees_date['month'], donnees_date['day'])
+    champ_mag = Champ_mag(date, fidelite=donnees_champ.get('fidelite', 'igrf'), degre=donnees_champ.get('degre', 3))
+    if donnees_champ.get('table', False):
+        champ_mag = TableChamp(champ_mag, donnees_orbite['inclinaison'],
+                               pas_altitude=donnees_champ.get('pas_altitude', 10),
+                               pas_argument=donnees_champ.get('pas_argument', 2),
+                               controle_periode=donnees_champ.get('controle_periode', 0),
+                               tolerance=donnees_champ.get('tolerance', 0.01))
+
+    return orbite, satellite, atmosphere, champ_mag
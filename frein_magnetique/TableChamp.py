@@ -0,0 +1,227 @@
+import numpy as np
+from collections import OrderedDict
+from math import cos, sin, pi
+from datetime import timedelta
+from .Constantes import *
+
+
+class TableChamp:
+    """
+    Table du champ magnétique construite au fil de la simulation et interpolée à chaque étape.
+
+    D'une révolution à l'autre, le satellite parcourt presque la même trace au sol et le champ varie lentement
+    avec l'altitude et la date. Les composantes est et nord du champ sont donc tabulées par bande d'altitude,
+    argument de latitude, phase en longitude de l'orbite (écart entre la longitude du satellite et celle du
+    même point sur l'orbite à phase nulle) et jour. Chaque anneau de la table (tous les arguments de latitude
+    d'une bande d'altitude, d'une phase et d'un jour) est calculé en un seul appel vectorisé au modèle de champ
+    la première fois qu'il est utilisé. Le nombre d'anneaux conservés en mémoire est borné.
+
+    La table s'utilise à la place d'un objet Champ_mag : elle fournit la même méthode calculer_Bt.
+
+    Attributes
+    ----------
+    champ_mag : Champ_mag
+        Le modèle de champ utilisé pour remplir la table et pour les contrôles.
+    inclinaison : float
+        L'inclinaison de l'orbite en degrés.
+    pas_altitude : float
+        La largeur d'une bande d'altitude en km.
+    pas_argument : float
+        Le pas en argument de latitude en degrés.
+    pas_longitude : float
+        Le pas en phase de longitude en degrés.
+    taille_max : int
+        Le nombre maximal d'anneaux conservés en mémoire.
+    controle_periode : int
+        Nombre d'évaluations entre deux contrôles contre l'évaluation directe (0 pour aucun contrôle).
+    tolerance : float
+        Écart relatif maximal admis lors d'un contrôle, rapporté à la norme du champ horizontal.
+        Au-delà, la valeur directe est utilisée.
+    erreur_max : float
+        Le plus grand écart relatif observé lors des contrôles.
+    nb_controles : int
+        Le nombre de contrôles effectués.
+    nb_depassements : int
+        Le nombre de contrôles ayant dépassé la tolérance.
+    """
+
+    def __init__(self, champ_mag, inclinaison, pas_altitude=10, pas_argument=2, pas_longitude=5, taille_max=64,
+                 controle_periode=0, tolerance=0.01):
+        """
+        Initialise une table vide.
+
+        Parameters
+        ----------
+        champ_mag : Champ_mag
+            Le modèle de champ utilisé pour remplir la table.
+        inclinaison : float
+            L'inclinaison de l'orbite en degrés.
+        pas_altitude : float, optional
+            La largeur d'une bande d'altitude en km (default is 10).
+        pas_argument : float, optional
+            Le pas en argument de latitude en degrés, diviseur de 360 (default is 2).
+        pas_longitude : float, optional
+            Le pas en phase de longitude en degrés (default is 5).
+        taille_max : int, optional
+            Le nombre maximal d'anneaux conservés en mémoire (default is 64).
+        controle_periode : int, optional
+            Nombre d'évaluations entre deux contrôles contre l'évaluation directe (default is 0, aucun contrôle).
+        tolerance : float, optional
+            Écart relatif maximal admis lors d'un contrôle (default is 0.01).
+        """
+        if 360 % pas_argument != 0:
+            raise ValueError(f"Le pas en argument de latitude doit diviser 360 (pas_argument = {pas_argument})")
+        self.champ_mag = champ_mag
+        self.inclinaison = inclinaison
+        self.pas_altitude = pas_altitude
+        self.pas_argument = pas_argument
+        self.pas_longitude = pas_longitude
+        self.taille_max = taille_max
+        self.controle_periode = controle_periode
+        self.tolerance = tolerance
+        self.date = champ_mag.date
+        self.dt = 0
+        self.anneaux = OrderedDict()
+        self.nb_evaluations = 0
+        self.nb_controles = 0
+        self.nb_depassements = 0
+        self.erreur_max = 0.0
+
+        self.arguments = np.radians(np.arange(0, 360, pas_argument))
+        self.latitudes, self.longitudes = self.position_sur_orbite(self.arguments)
+
+    def position_sur_orbite(self, argument_latitude):
+        """
+        Calcule la latitude et la longitude d'un point de l'orbite à phase de longitude nulle.
+
+        Parameters
+        ----------
+        argument_latitude : float or array
+            L'argument de latitude en radians.
+
+        Returns
+        -------
+        tuple
+            Latitude et longitude en degrés (voir Satellite_magnetique.update_etat).
+        """
+        i = self.inclinaison / 180 * pi
+        latitude = np.arcsin(np.sin(argument_latitude) * np.sin(i))
+        longitude = np.arctan2(np.sin(argument_latitude) * np.cos(i), np.cos(argument_latitude))
+        return np.degrees(latitude), np.degrees(longitude)
+
+    def anneau(self, bande, phase, jour):
+        """
+        Retourne les composantes est et nord du champ sur un anneau de la table, en le calculant au besoin.
+
+        Parameters
+        ----------
+        bande : int
+            L'indice de la bande d'altitude.
+        phase : int
+            L'indice de la phase de longitude.
+        jour : int
+            Le nombre de jours écoulés depuis la date initiale.
+
+        Returns
+        -------
+        tuple
+            Composantes est et nord en Tesla pour chaque argument de latitude de la table.
+        """
+        cle = (bande, phase, jour)
+        if cle in self.anneaux:
+            self.anneaux.move_to_end(cle)
+            return self.anneaux[cle]
+
+        longitudes = (self.longitudes + phase * self.pas_longitude + 180) % 360 - 180
+        be, bn, bu = self.champ_mag.calculer_composantes(bande * self.pas_altitude, self.latitudes, longitudes,
+                                                         self.date + timedelta(jour))
+        valeurs = (np.ravel(be) / 10 ** 9, np.ravel(bn) / 10 ** 9)
+
+        self.anneaux[cle] = valeurs
+        if len(self.anneaux) > self.taille_max:
+            self.anneaux.popitem(last=False)
+        return valeurs
+
+    def calculer_Bt(self, satellite, dt=0, vitesse=None):
+        """
+        Calcule la composante tangente du champ magnétique par interpolation dans la table.
+
+        L'interpolation est linéaire en altitude et en argument de latitude ; la phase de longitude
+        et le jour sont pris sur le noeud le plus proche.
+
+        Parameters
+        ----------
+        satellite : Satellite_magnetique
+            Le satellite, dont l'argument de latitude est mis à jour par update_etat.
+        dt : int, optional
+            Temps écoulé en secondes à ajouter à `self.dt` (default is 0).
+        vitesse : float, optional
+            Vitesse angulaire du satellite par rapport au nord (default is None).
+            Si None, utilise `satellite.angle_nord_vitesse`.
+
+        Returns
+        -------
+        float
+            La composante tangente du champ magnétique en Tesla.
+        """
+        if vitesse is None:
+            vitesse = satellite.angle_nord_vitesse
+        self.dt += dt
+        jour = int(self.dt // (24 * 3600))
+
+        altitude = (satellite.get_r() - rayon_terre) / 1000 / self.pas_altitude
+        bande = int(np.floor(altitude))
+        f_altitude = altitude - bande
+
+        argument = (satellite.argument_latitude % (2 * pi)) / np.radians(self.pas_argument)
+        j0 = int(argument) % len(self.arguments)
+        j1 = (j0 + 1) % len(self.arguments)
+        f_argument = argument - int(argument)
+
+        _, longitude_orbite = self.position_sur_orbite(satellite.argument_latitude)
+        ecart = (satellite.get_phi() * 180 / pi - longitude_orbite + 180) % 360 - 180
+        phase = int(round(ecart / self.pas_longitude))
+
+        composantes = []
+        for bas, haut in zip(self.anneau(bande, phase, jour), self.anneau(bande + 1, phase, jour)):
+            valeur_j0 = bas[j0] * (1 - f_altitude) + haut[j0] * f_altitude
+            valeur_j1 = bas[j1] * (1 - f_altitude) + haut[j1] * f_altitude
+            composantes.append(valeur_j0 * (1 - f_argument) + valeur_j1 * f_argument)
+        self.be, self.bn = composantes
+        self.bt = self.bn * sin(vitesse) + self.be * cos(vitesse)
+
+        self.nb_evaluations += 1
+        if self.controle_periode and self.nb_evaluations % self.controle_periode == 0:
+            self.controler(satellite, vitesse, jour)
+        return self.bt
+
+    def controler(self, satellite, vitesse, jour):
+        """
+        Compare la valeur interpolée à l'évaluation directe du modèle de champ à la position du satellite.
+
+        Si l'écart relatif dépasse la tolérance, la valeur directe remplace la valeur interpolée.
+
+        Parameters
+        ----------
+        satellite : Satellite_magnetique
+            Le satellite.
+        vitesse : float
+            Vitesse angulaire du satellite par rapport au nord.
+        jour : int
+            Le nombre de jours écoulés depuis la date initiale.
+        """
+        phi = satellite.get_phi() * 180 / pi
+        if phi >= 180:
+            phi = phi - 360
+        be, bn, bu = self.champ_mag.calculer_composantes((satellite.get_r() - rayon_terre) / 1000,
+                                                         satellite.get_theta() * 180 / pi, phi,
+                                                         self.date + timedelta(jour))
+        be, bn = float(np.ravel(be)[0]) / 10 ** 9, float(np.ravel(bn)[0]) / 10 ** 9
+        bt = bn * sin(vitesse) + be * cos(vitesse)
+
+        erreur = abs(self.bt - bt) / np.hypot(be, bn)
+        self.nb_controles += 1
+        self.erreur_max = max(self.erreur_max, erreur)
+        if erreur > self.tolerance:
+            self.nb_depassements += 1
+            self.be, self.bn, self.bt = be, bn, bt
@@ -3,4 +3,12 @@ from .Satellite_mag import *
 from .Orbite import *
 from .Atmopshere import *
 from .Materiau import *
-from .LecteurYAML import *
\ No newline at end of file
+from .LecteurYAML import *
+from .Scenario import *
+from .Convergence import *
+from .Criblage import *
+from .Observateurs import *
+from .CalibrationChamp import *
+from .TableChamp import *
+from .Comparaison import *
+from .Flotte import *
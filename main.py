@@ -8,18 +8,18 @@ Ce programme permet de :
 4. Calculer et afficher les résultats de la simulation.
 
 Modules utilisés:
-    - datetime: Pour manipuler les dates.
     - frein_magnetique: Module customisé pour le freinage magnétique.
     - frein_magnetique.LecteurYAML: Classe pour lire le fichier YAML.
     - os: Pour manipuler les chemins de fichiers.
+    - sys: Pour terminer le programme après une comparaison des deux approches.
 
 Auteur: Raphaël Barral, Fabien Bertrand, Ténessy De Faria
 Date: 2024-07-08
 """
 
-from datetime import datetime
 from frein_magnetique import *
 import os
+import sys
 
 approche = None
 
@@ -27,6 +27,7 @@ input("Entrez les paramètres de simulation dans le fichier data.yaml puis appuy
 print('Quelle approche souhaitez-vous utiliser pour effectuer les calculs ?')
 print('1. Approche énergétique')
 print('2. Approche basée sur le principe fondamental de la dynamique (PFD)')
+print('3. Comparaison des deux approches')
 
 while True:
     choix = input()
@@ -36,13 +37,28 @@ while True:
     elif choix == '2':
         approche = 'pfd'
         break
+    elif choix == '3':
+        approche = 'comparaison'
+        break
 
 # ---------------------Lecture du YAML---------------------
 whole_path = os.path.join(os.path.abspath(os.path.curdir), "data.yaml")
 parser = LecteurYAML(whole_path)
 parsed_data = parser.read_yaml()
 
-# ---------------------Création d'orbite---------------------
+# ---------------------Comparaison des deux approches---------------------
+if approche == 'comparaison':
+    comparaison = ComparaisonApproches(parsed_data)
+    comparaison.executer()
+    comparaison.afficher_resultats()
+    if filename := input('Entrez le nom du fichier de sortie (Laissez vide pour ne pas sauvegarder les données)'):
+        comparaison.save_data(filename)
+    sys.exit()
+
+# ---------------------Création de l'orbite, du satellite et du champ magnétique---------------------
+orbite, satMag, atmosphere_terrestre, champ_magnetique = construire_scenario(parsed_data)
+orbite.ajouter_observateur(BarreProgression())
+
 altitude = parsed_data['orbite']['altitude']
 inclinaison = parsed_data['orbite']['inclinaison']  # Inclinaison de l'orbite [°]
 dt = parsed_data['orbite']['dt']
@@ -57,28 +73,17 @@ section = parsed_data['satelitte_magnetique']['cable']['section']
 masse_ballaste = parsed_data['satelitte_magnetique']['cable']['ballast_mass']
 resistance_de_controle = parsed_data['satelitte_magnetique']['cable']['resistance_de_controle']
 
-# --------------------- Date ---------------------
-year = parsed_data['date']['year']
-month = parsed_data['date']['month']
-day = parsed_data['date']['day']
-
-date = datetime(year, month, day)
-champ_magnetique = Champ_mag(date)
-atmosphere_terrestre = Atmosphere()
-
-copper = Materiau(densite_cuivre, resistance_linéaire_cuivre)
-alu = Materiau(densite_alu, resistance_linéaire_alu)
-cable_mag = Cable(longueur, section, alu, mass_ballast=masse_ballaste, Rc=resistance_de_controle)
-satMag = Satellite_magnetique(masse_satelitte, surface_de_trainee, cable_mag)
-orbite = Orbite(altitude, inclinaison, dt=dt)
-
-
 satMag.calcul_des_masses()
 print(f"L'altitude initiale du satellite est {altitude:0.0f} m")
 print(f'La vitesse initiale du satellite est {orbite.calculer_vitesse_initial():0.2f} m/s-1')
 
 temps_deorb = orbite.calculer_temps_desorbitation(satMag, atmosphere_terrestre, champ_magnetique, approche)
-print(f'Le temps de désorbitation est de {temps_deorb:0.2f} jours.')
+if orbite.statut == STATUT_DESORBITE:
+    print(f'Le temps de désorbitation est de {temps_deorb:0.2f} jours.')
+else:
+    print(f'Simulation interrompue ({orbite.statut}) après {temps_deorb:0.2f} jours simulés.')
+    if orbite.duree_vie_estimee is not None:
+        print(f'La durée de vie extrapolée est de {orbite.duree_vie_estimee:0.2f} jours.')
 
 if input('Afficher courbe du temps de désorbitation (o/n)') == 'o':
     orbite.afficher_temps_desorbitation(donnees_sans_cable=False)